@@ -5,35 +5,94 @@ A terminal-based tool to manage product backlogs with local YAML storage.
 """
 
 import os
+import re
 import sys
-import yaml
-import csv
+import json
+import atexit
 import argparse
-import shlex
+from collections import Counter
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Set
+from dataclasses import dataclass, asdict, fields, MISSING
 from enum import Enum
-from art import *
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
-    from rich.text import Text
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich import box
-    from rich.markup import escape
-    import pandas as pd
-except ImportError:
+# rich is slow to import, so it is loaded on first output rather than here.
+_console = None
+
+
+def _exit_missing_packages():
+    """Tell the user how to install the required packages and exit."""
     print("Required packages not installed. Please run:")
-    print("pip install rich pyyaml pandas openpyxl")
+    print("pip install rich pyyaml openpyxl art")
     sys.exit(1)
 
 
+def _get_console():
+    """Return the shared rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+        except ImportError:
+            _exit_missing_packages()
+        _console = Console()
+    return _console
+
+# orjson is optional; it only speeds up reading and writing the journals.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _encode_json = orjson.dumps
+    _decode_json = orjson.loads
+else:
+    def _encode_json(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    _decode_json = json.loads
+
+
+def _load_yaml(data: bytes):
+    """Parse YAML, importing PyYAML only once a project is actually read."""
+    import yaml
+    # Prefer the libyaml-backed C implementation when PyYAML was built with it.
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(data, Loader=loader)
+
+# Strings that can be written as plain YAML scalars; anything else gets quoted.
+_PLAIN_RE = re.compile(r"[\w(/][\w ()/.,;'+&@?!-]*")
+# Plain scalars that YAML would resolve to something other than a string.
+_RESERVED_RE = re.compile(
+    r"y|Y|yes|Yes|YES|n|N|no|No|NO|true|True|TRUE|false|False|FALSE"
+    r"|on|On|ON|off|Off|OFF|null|Null|NULL"
+)
+_NUMBER_RE = re.compile(
+    r"[0-9][0-9_]*(?:\.[0-9_]*)?(?:[eE][-+]?[0-9]+)?|0[bxo][0-9a-fA-F_]+"
+)
+_TIMESTAMP_RE = re.compile(r"[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}")
+# Characters JSON leaves as-is that YAML treats as breaks or rejects outright.
+_YAML_UNSAFE_RE = re.compile("[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff]")
+
+
+def _yaml_escape(value: str) -> str:
+    """Return a YAML scalar for a string, quoting only when required."""
+    if (_PLAIN_RE.fullmatch(value) and not value.endswith(' ')
+            and not _RESERVED_RE.fullmatch(value)
+            and not _NUMBER_RE.fullmatch(value)
+            and not _TIMESTAMP_RE.match(value)):
+        return value
+    # JSON strings are valid YAML double-quoted scalars.
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _YAML_UNSAFE_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+
+
+class BacklogError(Exception):
+    """An expected, user-facing error such as a missing project or item."""
+
+
 class Priority(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -48,7 +107,58 @@ class Status(Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+# Shared choice tuples for argparse and interactive prompts.
+_PRIORITY = tuple(priority.value for priority in Priority)
+_STATUS = tuple(status.value for status in Status)
+
+
+_PRIORITY_COLOR = {
+    "critical": "[bold red]",
+    "high": "[red]",
+    "medium": "[yellow]",
+    "low": "[green]"
+}
+
+_STATUS_COLOR = {
+    "todo": "[blue]",
+    "in_progress": "[yellow]",
+    "done": "[green]",
+    "blocked": "[red]"
+}
+
+_BACKLOG_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Title", {"style": "white"}),
+    ("Priority", {"style": "red"}),
+    ("Status", {"style": "green"}),
+    ("Sprint", {"style": "blue"}),
+    ("Epic", {"style": "magenta"}),
+    ("Assignee", {"style": "yellow"}),
+    ("Points", {"justify": "right"}),
+)
+
+
+def _truncate_title(title: str, limit: int = 50, ellipsis: str = "...") -> str:
+    """Shorten a title for table display."""
+    return title if len(title) <= limit else title[:limit] + ellipsis
+
+
+def _make_backlog_table(title: str):
+    """Create an empty backlog items table with the standard columns."""
+    from rich.table import Table
+    from rich import box
+    
+    table = Table(title=title, box=box.ROUNDED)
+    for header, options in _BACKLOG_COLUMNS:
+        table.add_column(header, **options)
+    return table
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class BacklogItem:
     id: str
     title: str
@@ -63,66 +173,293 @@ class BacklogItem:
     updated_at: str = None
     
     def __post_init__(self):
+        now = None
         if not self.created_at:
-            self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+            now = self.created_at = datetime.now().isoformat()
+        if self.updated_at is None:
+            self.updated_at = now or datetime.now().isoformat()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BacklogItem':
+        """Rebuild a stored item as-is, without stamping fresh timestamps."""
+        values = {**_ITEM_DEFAULTS, **data}
+        item = object.__new__(cls)
+        for name in _ITEM_FIELDS:
+            setattr(item, name, values[name])
+        return item
+
+
+_ITEM_FIELDS = tuple(f.name for f in fields(BacklogItem))
+_ITEM_DEFAULTS = {f.name: f.default for f in fields(BacklogItem) if f.default is not MISSING}
+# Columns taken from imported CSV files; IDs and timestamps are always fresh.
+_CSV_IMPORT_FIELDS = tuple(f for f in _ITEM_FIELDS if f not in ('id', 'created_at', 'updated_at'))
+
+
+def _dump_item(item: BacklogItem) -> str:
+    """Render one backlog item as a YAML sequence entry of a flat mapping."""
+    lines = []
+    prefix = "- "
+    for key in _ITEM_FIELDS:
+        value = getattr(item, key)
+        if value is None:
+            lines.append(f"{prefix}{key}: null\n")
+        elif isinstance(value, str):
+            lines.append(f"{prefix}{key}: {_yaml_escape(value)}\n")
+        elif isinstance(value, int) and not isinstance(value, bool):
+            lines.append(f"{prefix}{key}: {value}\n")
+        else:
+            lines.append(f"{prefix}{key}: {_yaml_escape(str(value))}\n")
+        prefix = "  "
+    return "".join(lines)
+
+
+def _id_number(item_id: str) -> int:
+    """Return the numeric suffix of an item ID, or 0 if it has none."""
+    suffix = item_id.rsplit('-', 1)[-1]
+    return int(suffix) if suffix.isdigit() else 0
 
 
 class BacklogManager:
     def __init__(self, data_dir: str = "database_backlogd"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.console = Console()
+        # Projects are parsed on first access; only their names are read here.
+        self.project_names: Set[str] = self._scan_project_names()
         self.projects: Dict[str, List[BacklogItem]] = {}
-        self.load_projects()
+        self.status_counts: Dict[str, Counter] = {}
+        self.next_id: Dict[str, int] = {}
+        self.index: Dict[str, Dict[str, BacklogItem]] = {}
+        # Rendered YAML per item id, reused by save_project until the item changes.
+        self._serialized_cache: Dict[str, Dict[str, str]] = {}
+        self._dirty_ids: Dict[str, Set[str]] = {}
+        self._journal_fds: Dict[str, int] = {}
+    
+    @property
+    def console(self):
+        """Shared rich console, created on first use."""
+        return _get_console()
     
     def get_project_file(self, project_name: str) -> Path:
         """Get the YAML file path for a project."""
         return self.data_dir / f"{project_name}.yaml"
     
+    def get_journal_file(self, project_name: str) -> Path:
+        """Get the append-only journal path for a project."""
+        return self.data_dir / f"{project_name}.jsonl"
+    
+    def _scan_project_names(self) -> Set[str]:
+        """List the projects present in the data directory without parsing them."""
+        with os.scandir(self.data_dir) as entries:
+            return {entry.name[:-len('.yaml')] for entry in entries
+                    if entry.name.endswith('.yaml') and entry.is_file()}
+    
+    def get_project(self, project_name: str) -> Optional[List[BacklogItem]]:
+        """Return a project's items, loading it on first use; None if missing."""
+        items = self.projects.get(project_name)
+        if items is not None or project_name not in self.project_names:
+            return items
+        
+        _, items, next_id, error = self._parse_project_file(project_name)
+        if error is not None:
+            self.console.print(f"[red]Error loading {project_name}: {error}[/red]")
+            return None
+        self._register_project(project_name, items, next_id)
+        return items
+    
+    def require_project(self, project_name: str) -> List[BacklogItem]:
+        """Return a project's items, raising BacklogError if it does not exist."""
+        items = self.get_project(project_name)
+        if items is None:
+            raise BacklogError(f"Project '{project_name}' not found.")
+        return items
+    
+    def require_item(self, project_name: str, item_id: str) -> BacklogItem:
+        """Return an item, raising BacklogError if it or its project is missing."""
+        self.require_project(project_name)
+        item = self.index[project_name].get(item_id)
+        if item is None:
+            raise BacklogError(f"Item '{item_id}' not found in project '{project_name}'.")
+        return item
+    
     def load_projects(self):
-        """Load all projects from YAML files."""
-        for yaml_file in self.data_dir.glob("*.yaml"):
-            project_name = yaml_file.stem
-            try:
-                with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f) or []
-                self.projects[project_name] = [
-                    BacklogItem(**item) for item in data
-                ]
-            except Exception as e:
-                self.console.print(f"[red]Error loading {project_name}: {e}[/red]")
+        """Load every project not loaded yet from its snapshot and journal."""
+        pending = [name for name in self.project_names if name not in self.projects]
+        if not pending:
+            return
+        
+        # Projects are independent, so read them concurrently and merge here.
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            results = list(executor.map(self._parse_project_file, pending))
+        
+        for project_name, items, next_id, error in results:
+            if error is not None:
+                self.console.print(f"[red]Error loading {project_name}: {error}[/red]")
+                continue
+            self._register_project(project_name, items, next_id)
+    
+    def _parse_project_file(self, project_name: str):
+        """Read one project's snapshot and journal.
+        
+        Returns (name, items, next_id, error), where next_id is the lowest
+        item number the journal shows may be handed out again.
+        """
+        try:
+            with open(self.get_project_file(project_name), 'rb') as f:
+                data = _load_yaml(f.read()) or []
+            items = [BacklogItem.from_dict(item) for item in data]
+            items, next_id = self._replay_journal(project_name, items)
+            return project_name, items, next_id, None
+        except Exception as e:
+            return project_name, None, 1, e
+    
+    def _register_project(self, project_name: str, items: List[BacklogItem], next_id: int = 1):
+        """Install a loaded project and build its lookup caches."""
+        self.projects[project_name] = items
+        self.index[project_name] = {item.id: item for item in items}
+        self.status_counts[project_name] = Counter(item.status for item in items)
+        self.next_id[project_name] = max(next_id, self._first_free_id(items))
+    
+    @staticmethod
+    def _first_free_id(items: List[BacklogItem]) -> int:
+        """Return the item number after the highest one among live items."""
+        return 1 + max((_id_number(item.id) for item in items), default=0)
+    
+    def _replay_journal(self, project_name: str, items: List[BacklogItem]):
+        """Apply journaled mutations on top of a snapshot's items.
+        
+        Returns the items and the next item number implied by the journal,
+        which stays above deleted items' numbers.
+        """
+        journal_file = self.get_journal_file(project_name)
+        if not journal_file.exists():
+            return items, 1
+        
+        # Replaying by id keeps every op idempotent, so a journal left behind
+        # by an interrupted compaction is harmless.
+        by_id = {item.id: item for item in items}
+        next_id = 1
+        good_end = 0
+        torn = unterminated = False
+        with open(journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _decode_json(line)
+                except ValueError:
+                    # A torn trailing write from a crash; nothing after it is valid.
+                    torn = True
+                    break
+                good_end += len(line)
+                unterminated = not line.endswith(b"\n")
+                op = entry["op"]
+                if op == "delete":
+                    by_id.pop(entry["id"], None)
+                    next_id = max(next_id, _id_number(entry["id"]) + 1)
+                elif op == "next_id":
+                    next_id = max(next_id, entry["value"])
+                else:
+                    item = BacklogItem.from_dict(entry["item"])
+                    by_id[item.id] = item
+        
+        # Cut the journal back to its last complete entry before anything is
+        # appended, or the next entry would land on the same line as the torn
+        # bytes and be dropped by the next replay.
+        if torn or unterminated:
+            with open(journal_file, 'r+b') as f:
+                f.truncate(good_end)
+                if unterminated:
+                    f.seek(good_end)
+                    f.write(b"\n")
+        if torn:
+            self.console.print(
+                f"[yellow]Dropped an incomplete journal entry in project '{project_name}'.[/yellow]"
+            )
+        return list(by_id.values()), next_id
     
     def save_project(self, project_name: str):
         """Save a project to its YAML file."""
         if project_name not in self.projects:
-            return
+            return False
         
         project_file = self.get_project_file(project_name)
-        data = [asdict(item) for item in self.projects[project_name]]
         
+        # Only items that changed since the last save are rendered again;
+        # rebuilding the cache each time also drops deleted items from it.
+        cache = self._serialized_cache.get(project_name, {})
+        dirty = self._dirty_ids.pop(project_name, set())
+        rendered = {}
+        for item in self.projects[project_name]:
+            chunk = cache.get(item.id)
+            if chunk is None or item.id in dirty:
+                chunk = _dump_item(item)
+            rendered[item.id] = chunk
+        self._serialized_cache[project_name] = rendered
+        
+        try:
+            with open(project_file, 'w', encoding='utf-8') as f:
+                f.write("".join(rendered.values()) or "[]\n")
+            return True
+        except Exception as e:
+            self.console.print(f"[red]Error saving {project_name}: {e}[/red]")
+            return False
+    
+    def compact(self, project_name: str):
+        """Fold a project's journal into its YAML snapshot."""
+        # Only drop the journal once its contents are safely in the snapshot.
+        if not self.save_project(project_name):
+            return
+        
+        try:
+            with open(self.get_journal_file(project_name), 'wb') as f:
+                # The snapshot only holds live items, so carry the ID counter
+                # over when the highest numbers handed out were deleted.
+                next_id = self.next_id[project_name]
+                if next_id > self._first_free_id(self.projects[project_name]):
+                    f.write(_encode_json({"op": "next_id", "value": next_id}) + b"\n")
+        except Exception as e:
+            self.console.print(f"[red]Error compacting {project_name}: {e}[/red]")
+    
+    def _journal(self, project_name: str, entry: Dict[str, Any]):
+        """Record a single mutation without rewriting the whole project."""
         try:
-            with open(project_file, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            fd = self._journal_fds.get(project_name)
+            if fd is None:
+                # O_APPEND keeps writing at the end even after compact() truncates.
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+                fd = os.open(self.get_journal_file(project_name), flags, 0o644)
+                self._journal_fds[project_name] = fd
+            os.write(fd, _encode_json(entry) + b"\n")
+            journal_size = os.fstat(fd).st_size
+            if journal_size > self.get_project_file(project_name).stat().st_size:
+                self.compact(project_name)
         except Exception as e:
             self.console.print(f"[red]Error saving {project_name}: {e}[/red]")
     
+    def _adjust_status_count(self, project_name: str, status: str, delta: int):
+        """Keep the cached per-status counts in step with item mutations."""
+        counts = self.status_counts[project_name]
+        counts[status] += delta
+        if counts[status] <= 0:
+            del counts[status]
+    
     def list_projects(self):
         """Display all available projects."""
+        self.load_projects()
         if not self.projects:
             self.console.print("[yellow]No projects found.[/yellow]")
             return
         
+        from rich.table import Table
+        from rich import box
+        
         table = Table(title="Available Projects", box=box.ROUNDED)
         table.add_column("Project Name", style="cyan")
         table.add_column("Items", justify="right", style="magenta")
         table.add_column("Status", style="green")
         
-        for project_name, items in self.projects.items():
-            status_counts = {}
-            for item in items:
-                status_counts[item.status] = status_counts.get(item.status, 0) + 1
-            
+        for project_name, items in sorted(self.projects.items()):
+            status_counts = self.status_counts[project_name]
             status_text = " | ".join([f"{k}: {v}" for k, v in status_counts.items()])
             table.add_row(project_name, str(len(items)), status_text or "Empty")
         
@@ -130,50 +467,54 @@ class BacklogManager:
     
     def create_project(self, project_name: str):
         """Create a new project."""
-        if project_name in self.projects:
-            self.console.print(f"[red]Project '{project_name}' already exists.[/red]")
-            return False
+        if project_name in self.project_names:
+            raise BacklogError(f"Project '{project_name}' already exists.")
         
-        self.projects[project_name] = []
-        self.save_project(project_name)
+        self.project_names.add(project_name)
+        self._register_project(project_name, [])
+        self.compact(project_name)
         self.console.print(f"[green]Project '{project_name}' created successfully.[/green]")
         return True
     
     def delete_project(self, project_name: str):
         """Delete a project and its file."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return False
+        if project_name not in self.project_names:
+            raise BacklogError(f"Project '{project_name}' not found.")
+        
+        from rich.prompt import Confirm
         
         if Confirm.ask(f"Are you sure you want to delete project '{project_name}'?"):
-            project_file = self.get_project_file(project_name)
-            if project_file.exists():
-                project_file.unlink()
-            del self.projects[project_name]
+            fd = self._journal_fds.pop(project_name, None)
+            if fd is not None:
+                os.close(fd)
+            for project_file in (self.get_project_file(project_name),
+                                 self.get_journal_file(project_name)):
+                if project_file.exists():
+                    project_file.unlink()
+            self.project_names.discard(project_name)
+            for cache in (self.projects, self.status_counts, self.next_id, self.index,
+                          self._serialized_cache, self._dirty_ids):
+                cache.pop(project_name, None)
             self.console.print(f"[green]Project '{project_name}' deleted successfully.[/green]")
             return True
         return False
     
     def generate_item_id(self, project_name: str) -> str:
         """Generate a unique ID for a backlog item."""
-        if project_name not in self.projects:
+        if self.get_project(project_name) is None:
             return f"{project_name.upper()}-1"
         
-        existing_ids = [item.id for item in self.projects[project_name]]
-        counter = len(existing_ids) + 1
-        
-        while f"{project_name.upper()}-{counter}" in existing_ids:
-            counter += 1
-        
+        # Never hand out a number twice, even after the highest item is deleted;
+        # compact() journals the counter so this also holds across runs.
+        counter = self.next_id[project_name]
+        self.next_id[project_name] = counter + 1
         return f"{project_name.upper()}-{counter}"
     
     def add_item(self, project_name: str, title: str, description: str, 
                  priority: str = "medium", sprint: str = None, epic: str = None,
                  assignee: str = None, story_points: int = None):
         """Add a new backlog item to a project."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return False
+        self.require_project(project_name)
         
         item_id = self.generate_item_id(project_name)
         item = BacklogItem(
@@ -189,104 +530,125 @@ class BacklogManager:
         )
         
         self.projects[project_name].append(item)
-        self.save_project(project_name)
+        self.index[project_name][item_id] = item
+        self._adjust_status_count(project_name, item.status, 1)
+        self._journal(project_name, {"op": "add", "item": asdict(item)})
         
         self.console.print(f"[green]Item '{item_id}' added to project '{project_name}'.[/green]")
         return True
     
+    def add_items(self, project_name: str, items_data: List[Dict[str, Any]]):
+        """Add several backlog items to a project with a single save."""
+        self.require_project(project_name)
+        
+        items = self.projects[project_name]
+        index = self.index[project_name]
+        status_counts = self.status_counts[project_name]
+        added = 0
+        for data in items_data:
+            item = BacklogItem(
+                id=self.generate_item_id(project_name),
+                title=data['title'],
+                description=data.get('description') or "",
+                priority=data.get('priority') or Priority.MEDIUM.value,
+                status=data.get('status') or Status.TODO.value,
+                sprint=data.get('sprint'),
+                epic=data.get('epic'),
+                assignee=data.get('assignee'),
+                story_points=data.get('story_points')
+            )
+            items.append(item)
+            index[item.id] = item
+            status_counts[item.status] += 1
+            added += 1
+        
+        self.compact(project_name)
+        self.console.print(f"[green]{added} items added to project '{project_name}'.[/green]")
+        return True
+    
     def update_item(self, project_name: str, item_id: str, **kwargs):
         """Update an existing backlog item."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return False
+        item = self.require_item(project_name, item_id)
         
-        for item in self.projects[project_name]:
-            if item.id == item_id:
-                for key, value in kwargs.items():
-                    if hasattr(item, key) and value is not None:
-                        setattr(item, key, value)
-                item.updated_at = datetime.now().isoformat()
-                self.save_project(project_name)
-                self.console.print(f"[green]Item '{item_id}' updated successfully.[/green]")
-                return True
-        
-        self.console.print(f"[red]Item '{item_id}' not found in project '{project_name}'.[/red]")
-        return False
+        old_status = item.status
+        for key, value in kwargs.items():
+            if hasattr(item, key) and value is not None:
+                setattr(item, key, value)
+        if item.status != old_status:
+            self._adjust_status_count(project_name, old_status, -1)
+            self._adjust_status_count(project_name, item.status, 1)
+        item.updated_at = datetime.now().isoformat()
+        self._dirty_ids.setdefault(project_name, set()).add(item_id)
+        self._journal(project_name, {"op": "update", "item": asdict(item)})
+        self.console.print(f"[green]Item '{item_id}' updated successfully.[/green]")
+        return True
     
     def delete_item(self, project_name: str, item_id: str):
         """Delete a backlog item."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return False
+        item = self.require_item(project_name, item_id)
         
-        for i, item in enumerate(self.projects[project_name]):
-            if item.id == item_id:
-                if Confirm.ask(f"Delete item '{item_id}: {item.title}'?"):
-                    del self.projects[project_name][i]
-                    self.save_project(project_name)
-                    self.console.print(f"[green]Item '{item_id}' deleted successfully.[/green]")
-                    return True
-                return False
+        from rich.prompt import Confirm
         
-        self.console.print(f"[red]Item '{item_id}' not found.[/red]")
+        if Confirm.ask(f"Delete item '{item_id}: {item.title}'?"):
+            self.projects[project_name].remove(item)
+            del self.index[project_name][item_id]
+            self._adjust_status_count(project_name, item.status, -1)
+            self._journal(project_name, {"op": "delete", "id": item_id})
+            self.console.print(f"[green]Item '{item_id}' deleted successfully.[/green]")
+            return True
         return False
     
     def list_items(self, project_name: str = None, priority: str = None, 
-                   sprint: str = None, epic: str = None, status: str = None):
+                   sprint: str = None, epic: str = None, status: str = None,
+                   assignee: str = None):
         """List backlog items with optional filtering."""
-        if project_name and project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return
+        if project_name:
+            projects_to_show = {project_name: self.require_project(project_name)}
+        else:
+            self.load_projects()
+            projects_to_show = dict(sorted(self.projects.items()))
+        
+        # Bound once so the per-row loop only touches locals.
+        truncate = _truncate_title
+        priority_color_of = _PRIORITY_COLOR.get
+        status_color_of = _STATUS_COLOR.get
         
-        projects_to_show = {project_name: self.projects[project_name]} if project_name else self.projects
+        # Fold the active filters into one predicate: a single attrgetter call
+        # per item, compared against the wanted value (or tuple of values).
+        criteria = [
+            (field, value)
+            for field, value in (("priority", priority), ("sprint", sprint),
+                                 ("epic", epic), ("status", status),
+                                 ("assignee", assignee))
+            if value
+        ]
+        filter_key = filter_value = None
+        if criteria:
+            filter_fields, filter_values = zip(*criteria)
+            filter_key = attrgetter(*filter_fields)
+            filter_value = filter_values if len(filter_values) > 1 else filter_values[0]
         
         for proj_name, items in projects_to_show.items():
             if not items:
                 continue
             
-            # Apply filters
-            filtered_items = items
-            if priority:
-                filtered_items = [item for item in filtered_items if item.priority == priority]
-            if sprint:
-                filtered_items = [item for item in filtered_items if item.sprint == sprint]
-            if epic:
-                filtered_items = [item for item in filtered_items if item.epic == epic]
-            if status:
-                filtered_items = [item for item in filtered_items if item.status == status]
+            if filter_key:
+                filtered_items = [item for item in items if filter_key(item) == filter_value]
+            else:
+                filtered_items = items
             
             if not filtered_items:
                 continue
             
-            # Create table
-            table = Table(title=f"Backlog Items - {proj_name}", box=box.ROUNDED)
-            table.add_column("ID", style="cyan")
-            table.add_column("Title", style="white")
-            table.add_column("Priority", style="red")
-            table.add_column("Status", style="green")
-            table.add_column("Sprint", style="blue")
-            table.add_column("Epic", style="magenta")
-            table.add_column("Assignee", style="yellow")
-            table.add_column("Points", justify="right")
+            table = _make_backlog_table(f"Backlog Items - {proj_name}")
             
             for item in filtered_items:
-                priority_color = {
-                    "critical": "[bold red]",
-                    "high": "[red]",
-                    "medium": "[yellow]",
-                    "low": "[green]"
-                }.get(item.priority, "")
-                
-                status_color = {
-                    "todo": "[blue]",
-                    "in_progress": "[yellow]",
-                    "done": "[green]",
-                    "blocked": "[red]"
-                }.get(item.status, "")
+                priority_color = priority_color_of(item.priority, "")
+                status_color = status_color_of(item.status, "")
                 
                 table.add_row(
                     item.id,
-                    item.title[:50] + "..." if len(item.title) > 50 else item.title,
+                    truncate(item.title),
                     f"{priority_color}{item.priority}[/]",
                     f"{status_color}{item.status}[/]",
                     item.sprint or "-",
@@ -299,13 +661,9 @@ class BacklogManager:
     
     def show_item_details(self, project_name: str, item_id: str):
         """Show detailed information about a backlog item."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return
+        item = self.require_item(project_name, item_id)
         
-        for item in self.projects[project_name]:
-            if item.id == item_id:
-                panel_content = f"""
+        panel_content = f"""
 [bold cyan]Title:[/bold cyan] {item.title}
 [bold cyan]Description:[/bold cyan] {item.description}
 [bold cyan]Priority:[/bold cyan] {item.priority}
@@ -316,35 +674,34 @@ class BacklogManager:
 [bold cyan]Story Points:[/bold cyan] {item.story_points or 'Not estimated'}
 [bold cyan]Created:[/bold cyan] {item.created_at[:19] if item.created_at else 'Unknown'}
 [bold cyan]Updated:[/bold cyan] {item.updated_at[:19] if item.updated_at else 'Unknown'}
-                """.strip()
-                
-                panel = Panel(panel_content, title=f"Item Details - {item.id}", border_style="blue")
-                self.console.print(panel)
-                return
+        """.strip()
+        
+        from rich.panel import Panel
         
-        self.console.print(f"[red]Item '{item_id}' not found.[/red]")
+        panel = Panel(panel_content, title=f"Item Details - {item.id}", border_style="blue")
+        self.console.print(panel)
     
     def export_to_csv(self, project_name: str, filename: str = None):
         """Export project backlog to CSV."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return False
+        self.require_project(project_name)
         
         if not filename:
             filename = f"{project_name}_backlog_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
+        import csv
+        
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                 if not self.projects[project_name]:
                     self.console.print(f"[yellow]No items to export in project '{project_name}'.[/yellow]")
                     return False
                 
-                fieldnames = list(asdict(self.projects[project_name][0]).keys())
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for item in self.projects[project_name]:
-                    writer.writerow(asdict(item))
+                writer = csv.writer(csvfile)
+                writer.writerow(_ITEM_FIELDS)
+                writer.writerows(
+                    [getattr(item, field) for field in _ITEM_FIELDS]
+                    for item in self.projects[project_name]
+                )
             
             self.console.print(f"[green]Exported to {filename}[/green]")
             return True
@@ -352,11 +709,49 @@ class BacklogManager:
             self.console.print(f"[red]Export failed: {e}[/red]")
             return False
     
+    def import_from_csv(self, project_name: str, filename: str):
+        """Import backlog items from a CSV file into a project."""
+        self.require_project(project_name)
+        
+        import csv
+        
+        items_data = []
+        try:
+            # utf-8-sig drops the byte order mark Excel puts before the header.
+            with open(filename, 'r', newline='', encoding='utf-8-sig') as csvfile:
+                reader = csv.DictReader(csvfile)
+                for row in reader:
+                    data = {field: row.get(field) or None for field in _CSV_IMPORT_FIELDS}
+                    if not data['title']:
+                        continue
+                    # Nothing is imported unless every row is valid.
+                    for field, choices in (('priority', _PRIORITY), ('status', _STATUS)):
+                        if data[field] and data[field] not in choices:
+                            raise BacklogError(
+                                f"{filename}, line {reader.line_num}: invalid {field} "
+                                f"'{data[field]}' (expected one of: {', '.join(choices)})"
+                            )
+                    points = data['story_points']
+                    if points and not points.isdecimal():
+                        raise BacklogError(
+                            f"{filename}, line {reader.line_num}: invalid story_points "
+                            f"'{points}' (expected a whole number)"
+                        )
+                    data['story_points'] = int(points) if points else None
+                    items_data.append(data)
+        except (OSError, ValueError, csv.Error) as e:
+            self.console.print(f"[red]Import failed: {e}[/red]")
+            return False
+        
+        if not items_data:
+            self.console.print(f"[yellow]No items to import from {filename}.[/yellow]")
+            return False
+        
+        return self.add_items(project_name, items_data)
+    
     def export_to_xlsx(self, project_name: str, filename: str = None):
         """Export project backlog to Excel."""
-        if project_name not in self.projects:
-            self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            return False
+        self.require_project(project_name)
         
         if not self.projects[project_name]:
             self.console.print(f"[yellow]No items to export in project '{project_name}'.[/yellow]")
@@ -366,9 +761,16 @@ class BacklogManager:
             filename = f"{project_name}_backlog_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
         try:
-            data = [asdict(item) for item in self.projects[project_name]]
-            df = pd.DataFrame(data)
-            df.to_excel(filename, index=False, engine='openpyxl')
+            # Imported here so the rest of the CLI never pays for openpyxl.
+            from openpyxl import Workbook
+            
+            # Write-only workbooks stream rows to disk instead of holding cells.
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("Sheet1")
+            sheet.append(_ITEM_FIELDS)
+            for item in self.projects[project_name]:
+                sheet.append([getattr(item, field) for field in _ITEM_FIELDS])
+            workbook.save(filename)
             self.console.print(f"[green]Exported to {filename}[/green]")
             return True
         except Exception as e:
@@ -376,12 +778,25 @@ class BacklogManager:
             return False
 
 
+# Keyword filters accepted by 'items' in interactive mode.
+_LIST_FILTERS = ('priority', 'sprint', 'epic', 'status', 'assignee')
+
+
+# A quoted string (either quote style) or a run of non-space characters.
+# An unmatched quote is simply kept as part of a bare token.
+_TOKEN_RE = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\S+)')
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split shell input into words, honouring simple quoting."""
+    return [match.group(match.lastindex) for match in _TOKEN_RE.finditer(text)]
+
+
 class InteractiveCLI:
     """Interactive CLI shell for the product backlog manager."""
     
     def __init__(self, manager: BacklogManager):
         self.manager = manager
-        self.console = Console()
         self.current_project = None
         self.running = True
         
@@ -408,6 +823,7 @@ class InteractiveCLI:
             'update': self.update_item,
             'delete': self.delete_item,
             'show': self.show_item,
+            'import-csv': self.import_csv,
             
             # Export commands
             'export-csv': self.export_csv,
@@ -416,10 +832,21 @@ class InteractiveCLI:
             # Status
             'status': self.show_status,
         }
+        self._known = frozenset(self.commands)
+        
+        # Built once; printed on every unrecognised command.
+        from rich.text import Text
+        self._help_hint = Text("Type 'help' for available commands.", style="yellow")
+    
+    @property
+    def console(self):
+        """The console shared with the manager."""
+        return self.manager.console
     
     def show_banner(self):
         """Display the application banner."""
-
+        from art import text2art
+        
         ascii_art = text2art("backlogd")
         subtitle = """
 Product Backlog Manager for CLI
@@ -428,6 +855,8 @@ A powerful terminal-based tool for managing product backlogs with YAML storage a
 
 Type 'help' for available commands or 'exit' to quit. 
         """
+        from rich.text import Text
+        
         self.console.print(Text(ascii_art, style="bold cyan"))
         self.console.print(subtitle, style="bold cyan")
     
@@ -459,6 +888,7 @@ Type 'help' for available commands or 'exit' to quit.
   update <id>          Update an item (interactive)
   delete <id>          Delete an item
   show <id>            Show item details
+  import-csv <file>    Import items from a CSV file
 
 [bold yellow]Export:[/bold yellow]
   export-csv [filename]  Export current project to CSV
@@ -478,6 +908,8 @@ Type 'help' for available commands or 'exit' to quit.
   update TEST-APP-1
   show TEST-APP-1
         """
+        from rich.panel import Panel
+        
         panel = Panel(help_text, title="Help", border_style="blue")
         self.console.print(panel)
     
@@ -497,21 +929,21 @@ Type 'help' for available commands or 'exit' to quit.
         status_info = f"""
 [bold cyan]Current Status:[/bold cyan]
 • Active Project: {self.current_project or 'None'}
-• Total Projects: {len(self.manager.projects)}
+• Total Projects: {len(self.manager.project_names)}
 • Data Directory: {self.manager.data_dir}
         """
         
-        if self.current_project and self.current_project in self.manager.projects:
-            items = self.manager.projects[self.current_project]
-            status_counts = {}
-            for item in items:
-                status_counts[item.status] = status_counts.get(item.status, 0) + 1
+        items = self.manager.get_project(self.current_project) if self.current_project else None
+        if items is not None:
+            status_counts = self.manager.status_counts[self.current_project]
             
             status_info += f"\n[bold cyan]Current Project Items:[/bold cyan]\n"
             for status, count in status_counts.items():
                 status_info += f"• {status}: {count}\n"
             status_info += f"• Total: {len(items)}"
         
+        from rich.panel import Panel
+        
         panel = Panel(status_info.strip(), title="Status", border_style="green")
         self.console.print(panel)
     
@@ -526,12 +958,12 @@ Type 'help' for available commands or 'exit' to quit.
             return
         
         project_name = args[0]
-        if project_name in self.manager.projects:
+        if project_name in self.manager.project_names:
             self.current_project = project_name
             self.console.print(f"[green]Switched to project '{project_name}'[/green]")
         else:
             self.console.print(f"[red]Project '{project_name}' not found.[/red]")
-            self.console.print(f"[yellow]Available projects: {', '.join(self.manager.projects.keys())}[/yellow]")
+            self.console.print(f"[yellow]Available projects: {', '.join(sorted(self.manager.project_names))}[/yellow]")
     
     def create_project(self, args):
         """Create a new project."""
@@ -574,6 +1006,11 @@ Type 'help' for available commands or 'exit' to quit.
         while i < len(args):
             if args[i].startswith('--'):
                 filter_name = args[i][2:]  # Remove '--'
+                if filter_name not in _LIST_FILTERS:
+                    raise BacklogError(
+                        f"Unknown filter: --{filter_name} "
+                        f"(expected one of: {', '.join('--' + name for name in _LIST_FILTERS)})"
+                    )
                 if i + 1 < len(args) and not args[i + 1].startswith('--'):
                     filters[filter_name] = args[i + 1]
                     i += 2
@@ -585,6 +1022,8 @@ Type 'help' for available commands or 'exit' to quit.
     
     def add_item(self, args):
         """Interactive add item."""
+        from rich.prompt import Prompt
+        
         if not self.current_project:
             self.console.print("[red]No project selected. Use 'use <project>' to select a project.[/red]")
             return
@@ -601,7 +1040,7 @@ Type 'help' for available commands or 'exit' to quit.
             # Get optional fields
             priority = Prompt.ask(
                 "[cyan]Priority[/cyan]", 
-                choices=["low", "medium", "high", "critical"], 
+                choices=_PRIORITY, 
                 default="medium"
             )
             
@@ -625,11 +1064,11 @@ Type 'help' for available commands or 'exit' to quit.
         
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Operation cancelled.[/yellow]")
-        except Exception as e:
-            self.console.print(f"[red]Error adding item: {e}[/red]")
     
     def update_item(self, args):
         """Interactive update item."""
+        from rich.prompt import Prompt
+        
         if not self.current_project:
             self.console.print("[red]No project selected. Use 'use <project>' to select a project.[/red]")
             return
@@ -640,16 +1079,7 @@ Type 'help' for available commands or 'exit' to quit.
         
         item_id = args[0]
         
-        # Find the item first
-        item = None
-        for i in self.manager.projects[self.current_project]:
-            if i.id == item_id:
-                item = i
-                break
-        
-        if not item:
-            self.console.print(f"[red]Item '{item_id}' not found.[/red]")
-            return
+        item = self.manager.require_item(self.current_project, item_id)
         
         try:
             self.console.print(f"[cyan]Updating item '{item_id}': {item.title}[/cyan]")
@@ -668,7 +1098,7 @@ Type 'help' for available commands or 'exit' to quit.
             
             new_priority = Prompt.ask(
                 f"Priority [{item.priority}]",
-                choices=["low", "medium", "high", "critical"],
+                choices=_PRIORITY,
                 default=""
             )
             if new_priority:
@@ -676,7 +1106,7 @@ Type 'help' for available commands or 'exit' to quit.
             
             new_status = Prompt.ask(
                 f"Status [{item.status}]",
-                choices=["todo", "in_progress", "done", "blocked"],
+                choices=_STATUS,
                 default=""
             )
             if new_status:
@@ -705,8 +1135,6 @@ Type 'help' for available commands or 'exit' to quit.
         
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Operation cancelled.[/yellow]")
-        except Exception as e:
-            self.console.print(f"[red]Error updating item: {e}[/red]")
     
     def delete_item(self, args):
         """Delete an item."""
@@ -734,6 +1162,18 @@ Type 'help' for available commands or 'exit' to quit.
         item_id = args[0]
         self.manager.show_item_details(self.current_project, item_id)
     
+    def import_csv(self, args):
+        """Import items from CSV."""
+        if not self.current_project:
+            self.console.print("[red]No project selected. Use 'use <project>' to select a project.[/red]")
+            return
+        
+        if not args:
+            self.console.print("[red]Usage: import-csv <filename>[/red]")
+            return
+        
+        self.manager.import_from_csv(self.current_project, args[0])
+    
     def export_csv(self, args):
         """Export to CSV."""
         if not self.current_project:
@@ -754,144 +1194,264 @@ Type 'help' for available commands or 'exit' to quit.
     
     def parse_command(self, user_input):
         """Parse user input into command and arguments."""
+        text = user_input.strip()
+        # Most commands have no quoting, so plain whitespace splitting will do.
+        if '"' in text or "'" in text:
+            parts = _tokenize(text)
+        else:
+            parts = text.split()
+        if not parts:
+            return None, []
+        return parts[0].lower(), parts[1:]
+    
+    def load_history(self):
+        """Restore command history and save it on exit, if readline exists."""
         try:
-            parts = shlex.split(user_input.strip())
-            if not parts:
-                return None, []
-            return parts[0].lower(), parts[1:]
-        except ValueError:
-            # Handle unmatched quotes
-            parts = user_input.strip().split()
-            if not parts:
-                return None, []
-            return parts[0].lower(), parts[1:]
+            import readline
+        except ImportError:
+            return
+        
+        history_file = str(self.manager.data_dir / ".backlogd_history")
+        try:
+            readline.read_history_file(history_file)
+        except OSError:
+            pass
+        readline.set_history_length(1000)
+        
+        def save_history():
+            try:
+                readline.write_history_file(history_file)
+            except OSError:
+                pass
+        atexit.register(save_history)
     
     def run(self):
         """Run the interactive CLI."""
+        from rich.prompt import Prompt
+        
         self.show_banner()
+        self.load_history()
+        
+        console = self.console
+        print_ = console.print
+        commands = self.commands
+        known = self._known
         
         while self.running:
             try:
-                user_input = Prompt.ask(self.get_prompt(), console=self.console)
+                user_input = Prompt.ask(self.get_prompt(), console=console)
                 
                 if not user_input.strip():
                     continue
                 
                 command, args = self.parse_command(user_input)
                 
-                if command in self.commands:
-                    self.commands[command](args)
-                else:
-                    self.console.print(f"[red]Unknown command: {command}[/red]")
-                    self.console.print("[yellow]Type 'help' for available commands.[/yellow]")
+                # Unknown commands are reported before any handler runs.
+                if command not in known:
+                    print_(f"Unknown command: {command}", style="red", markup=False)
+                    print_(self._help_hint)
+                    continue
+                
+                # Only expected errors are reported here; anything else is a
+                # bug and reaches main()'s last-resort handler.
+                try:
+                    commands[command](args)
+                except BacklogError as e:
+                    print_(str(e), style="red", markup=False)
             
             except KeyboardInterrupt:
-                self.console.print("\n[yellow]Use 'exit' to quit.[/yellow]")
+                print_("\n[yellow]Use 'exit' to quit.[/yellow]")
             except EOFError:
-                self.console.print("\n[yellow]Goodbye! 👋[/yellow]\n")
-                self.console.print("[yellow]Built by [link=https://bugrakilic.net]Bugra Kilic[/link] with [link=https://claude.ai]Claude[/link] © 2025[/yellow]\n")
+                print_("\n[yellow]Goodbye! 👋[/yellow]\n")
+                print_("[yellow]Built by [link=https://bugrakilic.net]Bugra Kilic[/link] with [link=https://claude.ai]Claude[/link] © 2025[/yellow]\n")
                 break
-            except Exception as e:
-                self.console.print(f"[red]Error: {e}[/red]")
 
 
-def create_parser():
-    """Create the argument parser for the CLI."""
-    parser = argparse.ArgumentParser(description="backlogd - CLI Product Backlog Manager")
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+# Static description of the command-line interface, from which create_parser
+# builds argparse objects. Options of 'item add' and 'item update' default to
+# SUPPRESS, so only the ones actually given appear on the parsed namespace:
+#   command -> (help, dest, {action: (help, ((flags, options), ...))})
+# ArgumentParser instances cannot be pickled, so there is no on-disk parser
+# cache; this literal is already stored in the module's bytecode cache.
+_PARSER_SPEC = {
+    'project': ('Project management', 'project_action', {
+        'list': ('List all projects', ()),
+        'create': ('Create a new project', (
+            (('name',), {'help': 'Project name'}),
+        )),
+        'delete': ('Delete a project', (
+            (('name',), {'help': 'Project name'}),
+        )),
+    }),
+    'item': ('Item management', 'item_action', {
+        'add': ('Add a new item', (
+            (('project',), {'help': 'Project name'}),
+            (('title',), {'help': 'Item title'}),
+            (('description',), {'help': 'Item description'}),
+            (('--priority',), {'choices': _PRIORITY, 'default': argparse.SUPPRESS}),
+            (('--sprint',), {'help': 'Sprint name', 'default': argparse.SUPPRESS}),
+            (('--epic',), {'help': 'Epic name', 'default': argparse.SUPPRESS}),
+            (('--assignee',), {'help': 'Assignee name', 'default': argparse.SUPPRESS}),
+            (('--points',), {'type': int, 'help': 'Story points', 'default': argparse.SUPPRESS}),
+        )),
+        'update': ('Update an item', (
+            (('project',), {'help': 'Project name'}),
+            (('id',), {'help': 'Item ID'}),
+            (('--title',), {'help': 'New title', 'default': argparse.SUPPRESS}),
+            (('--description',), {'help': 'New description', 'default': argparse.SUPPRESS}),
+            (('--priority',), {'choices': _PRIORITY, 'default': argparse.SUPPRESS}),
+            (('--status',), {'choices': _STATUS, 'default': argparse.SUPPRESS}),
+            (('--sprint',), {'help': 'Sprint name', 'default': argparse.SUPPRESS}),
+            (('--epic',), {'help': 'Epic name', 'default': argparse.SUPPRESS}),
+            (('--assignee',), {'help': 'Assignee name', 'default': argparse.SUPPRESS}),
+            (('--points',), {'type': int, 'help': 'Story points', 'default': argparse.SUPPRESS}),
+        )),
+        'delete': ('Delete an item', (
+            (('project',), {'help': 'Project name'}),
+            (('id',), {'help': 'Item ID'}),
+        )),
+        'show': ('Show item details', (
+            (('project',), {'help': 'Project name'}),
+            (('id',), {'help': 'Item ID'}),
+        )),
+        'list': ('List items', (
+            (('--project',), {'help': 'Project name'}),
+            (('--priority',), {'choices': _PRIORITY}),
+            (('--sprint',), {'help': 'Sprint name'}),
+            (('--epic',), {'help': 'Epic name'}),
+            (('--status',), {'choices': _STATUS}),
+        )),
+    }),
+    'export': ('Export data', 'export_format', {
+        'csv': ('Export to CSV', (
+            (('project',), {'help': 'Project name'}),
+            (('--filename',), {'help': 'Output filename'}),
+        )),
+        'xlsx': ('Export to Excel', (
+            (('project',), {'help': 'Project name'}),
+            (('--filename',), {'help': 'Output filename'}),
+        )),
+    }),
+}
+
+
+def _add_subparser(subparsers, command: str):
+    """Add a top-level command and all of its actions from the spec."""
+    help_text, dest, actions = _PARSER_SPEC[command]
+    command_parser = subparsers.add_parser(command, help=help_text)
+    action_subparsers = command_parser.add_subparsers(dest=dest)
     
-    # Project commands
-    proj_parser = subparsers.add_parser('project', help='Project management')
-    proj_subparsers = proj_parser.add_subparsers(dest='project_action')
+    for action, (action_help, arguments) in actions.items():
+        action_parser = action_subparsers.add_parser(action, help=action_help)
+        for flags, options in arguments:
+            action_parser.add_argument(*flags, **options)
+
+
+# 'item add' / 'item update' options and the BacklogItem fields they set.
+_ADD_FIELDS = (
+    ('priority', 'priority'),
+    ('sprint', 'sprint'),
+    ('epic', 'epic'),
+    ('assignee', 'assignee'),
+    ('points', 'story_points'),
+)
+_UPDATE_FIELDS = (
+    ('title', 'title'),
+    ('description', 'description'),
+    ('priority', 'priority'),
+    ('status', 'status'),
+    ('sprint', 'sprint'),
+    ('epic', 'epic'),
+    ('assignee', 'assignee'),
+    ('points', 'story_points'),
+)
+
+
+_DESCRIPTION = "backlogd - CLI Product Backlog Manager"
+_DEBUG_HELP = "Show a traceback for unexpected errors"
+
+
+def _format_help_rows(rows, column: int) -> str:
+    """Lay out (label, help) rows the way argparse's default formatter does."""
+    lines = []
+    for label, text in rows:
+        if not text:
+            lines.append(f"{label}\n")
+        elif len(label) <= column - 2:
+            lines.append(f"{label:<{column}}{text}\n")
+        else:
+            lines.append(f"{label}\n{'':{column}}{text}\n")
+    return "".join(lines)
+
+
+def _print_quick_help(prog: str, command: str = None):
+    """Print top-level or per-command help straight from _PARSER_SPEC.
     
-    proj_subparsers.add_parser('list', help='List all projects')
+    Covers plain ``backlogd -h`` and ``backlogd <command> -h`` without
+    building any argparse objects. Returns False, printing nothing, when the
+    terminal is too narrow for the unwrapped layout; argparse then wraps it.
+    """
+    import shutil
     
-    create_proj = proj_subparsers.add_parser('create', help='Create a new project')
-    create_proj.add_argument('name', help='Project name')
+    # argparse's formatter leaves a two-column margin and narrows the help
+    # column below 24 only when the width is under 44.
+    width = shutil.get_terminal_size().columns - 2
+    if width < 44:
+        return False
     
-    delete_proj = proj_subparsers.add_parser('delete', help='Delete a project')
-    delete_proj.add_argument('name', help='Project name')
+    if command is None:
+        entries = {name: spec[0] for name, spec in _PARSER_SPEC.items()}
+        choices = "{" + ",".join(entries) + "}"
+        header = f"usage: {prog} [-h] [--debug] {choices} ...\n\n{_DESCRIPTION}\n\n"
+        choices_help = "Available commands"
+        extra_options = [("  --debug", _DEBUG_HELP)]
+    else:
+        entries = {name: spec[0] for name, spec in _PARSER_SPEC[command][2].items()}
+        choices = "{" + ",".join(entries) + "}"
+        header = f"usage: {prog} {command} [-h] {choices} ...\n\n"
+        choices_help = None
+        extra_options = []
     
-    # Item commands
-    item_parser = subparsers.add_parser('item', help='Item management')
-    item_subparsers = item_parser.add_subparsers(dest='item_action')
-    
-    # Add item
-    add_item = item_subparsers.add_parser('add', help='Add a new item')
-    add_item.add_argument('project', help='Project name')
-    add_item.add_argument('title', help='Item title')
-    add_item.add_argument('description', help='Item description')
-    add_item.add_argument('--priority', choices=['low', 'medium', 'high', 'critical'], default='medium')
-    add_item.add_argument('--sprint', help='Sprint name')
-    add_item.add_argument('--epic', help='Epic name')
-    add_item.add_argument('--assignee', help='Assignee name')
-    add_item.add_argument('--points', type=int, help='Story points')
-    
-    # Update item
-    update_item = item_subparsers.add_parser('update', help='Update an item')
-    update_item.add_argument('project', help='Project name')
-    update_item.add_argument('id', help='Item ID')
-    update_item.add_argument('--title', help='New title')
-    update_item.add_argument('--description', help='New description')
-    update_item.add_argument('--priority', choices=['low', 'medium', 'high', 'critical'])
-    update_item.add_argument('--status', choices=['todo', 'in_progress', 'done', 'blocked'])
-    update_item.add_argument('--sprint', help='Sprint name')
-    update_item.add_argument('--epic', help='Epic name')
-    update_item.add_argument('--assignee', help='Assignee name')
-    update_item.add_argument('--points', type=int, help='Story points')
-    
-    # Delete item
-    delete_item = item_subparsers.add_parser('delete', help='Delete an item')
-    delete_item.add_argument('project', help='Project name')
-    delete_item.add_argument('id', help='Item ID')
-    
-    # Show item details
-    show_item = item_subparsers.add_parser('show', help='Show item details')
-    show_item.add_argument('project', help='Project name')
-    show_item.add_argument('id', help='Item ID')
-    
-    # List items
-    list_items = item_subparsers.add_parser('list', help='List items')
-    list_items.add_argument('--project', help='Project name')
-    list_items.add_argument('--priority', choices=['low', 'medium', 'high', 'critical'])
-    list_items.add_argument('--sprint', help='Sprint name')
-    list_items.add_argument('--epic', help='Epic name')
-    list_items.add_argument('--status', choices=['todo', 'in_progress', 'done', 'blocked'])
+    positional = [("  " + choices, choices_help)]
+    positional.extend(("    " + name, text) for name, text in entries.items())
+    optional = [("  -h, --help", "show this help message and exit")] + extra_options
+    # Both sections share one help column, as in argparse.
+    column = min(24, max(len(label) for label, _ in positional + optional) + 2)
+    options_heading = "options:" if sys.version_info >= (3, 10) else "optional arguments:"
     
-    # Export commands
-    export_parser = subparsers.add_parser('export', help='Export data')
-    export_subparsers = export_parser.add_subparsers(dest='export_format')
+    text = (
+        header
+        + "positional arguments:\n" + _format_help_rows(positional, column)
+        + f"\n{options_heading}\n" + _format_help_rows(optional, column)
+    )
+    if any(len(line) > width for line in text.splitlines()):
+        return False
+    sys.stdout.write(text)
+    return True
+
+
+def create_parser(command: str = None):
+    """Create the argument parser for the CLI.
     
-    csv_export = export_subparsers.add_parser('csv', help='Export to CSV')
-    csv_export.add_argument('project', help='Project name')
-    csv_export.add_argument('--filename', help='Output filename')
+    Only the subparser for ``command`` is fully built; the other top-level
+    commands are registered as bare stubs so they still appear in the help
+    and are accepted as choices.
+    """
+    parser = argparse.ArgumentParser(description=_DESCRIPTION)
+    parser.add_argument('--debug', action='store_true', help=_DEBUG_HELP)
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    xlsx_export = export_subparsers.add_parser('xlsx', help='Export to Excel')
-    xlsx_export.add_argument('project', help='Project name')
-    xlsx_export.add_argument('--filename', help='Output filename')
+    for name, (help_text, _, _) in _PARSER_SPEC.items():
+        if name == command:
+            _add_subparser(subparsers, name)
+        else:
+            subparsers.add_parser(name, help=help_text, add_help=False)
     
     return parser
 
 
-def main():
-    """Main CLI entry point."""
-    parser = create_parser()
-    
-    # If no arguments provided, start interactive mode
-    if len(sys.argv) == 1:
-        manager = BacklogManager()
-        cli = InteractiveCLI(manager)
-        cli.run()
-        return
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return
-    
-    manager = BacklogManager()
-    
+def run_command(manager: BacklogManager, args):
+    """Dispatch a parsed one-shot command to the manager."""
     # Project commands
     if args.command == 'project':
         if args.project_action == 'list':
@@ -904,14 +1464,12 @@ def main():
     # Item commands
     elif args.command == 'item':
         if args.item_action == 'add':
-            manager.add_item(
-                args.project, args.title, args.description,
-                priority=args.priority, sprint=args.sprint, epic=args.epic,
-                assignee=args.assignee, story_points=args.points
-            )
+            options = {field: getattr(args, option)
+                       for option, field in _ADD_FIELDS if hasattr(args, option)}
+            manager.add_item(args.project, args.title, args.description, **options)
         elif args.item_action == 'update':
-            update_data = {k: v for k, v in vars(args).items() 
-                          if v is not None and k not in ['command', 'item_action', 'project', 'id']}
+            update_data = {field: getattr(args, option)
+                           for option, field in _UPDATE_FIELDS if hasattr(args, option)}
             manager.update_item(args.project, args.id, **update_data)
         elif args.item_action == 'delete':
             manager.delete_item(args.project, args.id)
@@ -931,5 +1489,43 @@ def main():
             manager.export_to_xlsx(args.project, args.filename)
 
 
+def main():
+    """Main CLI entry point."""
+    # 'backlogd -h' and 'backlogd <command> -h' are answered from the spec.
+    if 2 <= len(sys.argv) <= 3 and sys.argv[-1] in ('-h', '--help'):
+        help_command = sys.argv[1] if len(sys.argv) == 3 else None
+        if help_command is None or help_command in _PARSER_SPEC:
+            if _print_quick_help(os.path.basename(sys.argv[0]), help_command):
+                return
+    
+    args = None
+    if len(sys.argv) > 1:
+        command = next((arg for arg in sys.argv[1:] if not arg.startswith('-')), None)
+        args = create_parser(command).parse_args()
+    
+    try:
+        manager = BacklogManager()
+        # Without a command (just 'backlogd' or 'backlogd --debug'),
+        # start interactive mode.
+        if args is None or not args.command:
+            InteractiveCLI(manager).run()
+        else:
+            run_command(manager, args)
+    except BacklogError as e:
+        _get_console().print(str(e), style="red", markup=False)
+        sys.exit(1)
+    except ImportError:
+        # Dependencies are imported where first needed, so a missing one can
+        # surface from any command rather than at startup.
+        _exit_missing_packages()
+    except Exception as e:
+        if args is not None and args.debug:
+            import traceback
+            traceback.print_exc()
+        else:
+            print(f"Unexpected error: {e} (rerun with --debug for a traceback)", file=sys.stderr)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file